@@ -1,7 +1,44 @@
 import os
+import re
+import csv
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+import numpy as np
 import pandas as pd
 
+# pyarrow is optional: when installed, CSV files are parsed by its multi-threaded reader and
+# query results can be written as Parquet or with its multi-threaded CSV writer.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# duckdb is optional: only needed for FeedzaiChallenge(..., backend='duckdb').
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# pandas dtypes of CSV_SCHEMAS mapped to DuckDB column types.
+DUCKDB_TYPES = {'int32': 'INTEGER', 'int64': 'BIGINT'}
+
+
+@lru_cache(maxsize=32)
+def _load_sql(path: str, mtime: float) -> str:
+    """
+    Reads a SQL file, caching its contents per path and modification time so
+    repeated queries don't hit the disk again unless the file changed.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
+
 
 class FeedzaiChallenge:
     """
@@ -12,24 +49,104 @@ class FeedzaiChallenge:
     -----------
     database_name : str
         The name of the SQLite database to create and connect to.
-    conn : sqlite3.Connection
-        The SQLite connection object.
+    persistent : bool
+        Whether the SQLite database is stored on disk or kept in memory.
+    backend : str
+        The database engine running the queries, 'sqlite' or 'duckdb'.
+    durable : bool
+        Whether the SQLite database keeps its default durability guarantees.
+    conn : sqlite3.Connection or duckdb.DuckDBPyConnection
+        The database connection object.
     dfs : dict
         A dictionary to hold DataFrames read from CSV files.
 
     Methods:
     --------
-    read_csv_files(csv_files: dict):
+    read_csv_files(csv_files: dict, schemas: dict = None):
         Reads CSV files into DataFrames and stores them in a dictionary.
     load_data(table_name: str):
         Loads a DataFrame into the SQLite database as a table.
-    query_data(query: str, output_path: str):
-        Executes a SQL query and writes the results to a CSV file.
+    load_csv_directly(table_name: str, path: str):
+        Streams a CSV file straight into the SQLite database as a table.
+    build_working_days():
+        Creates the all_working_days calendar table used by the project utilization query.
+    query_data(query: str, output_path: str, conn: sqlite3.Connection = None, output_format: str = 'csv'):
+        Executes a SQL query and writes the results to a CSV or Parquet file.
+    query_data_concurrently(queries: dict, output_format: str = 'csv'):
+        Executes several SQL queries in parallel, each on its own connection.
+    open_read_connection():
+        Opens an extra connection to the database for running queries.
+    compute_accumulated_cost(output_path: str):
+        Computes the accumulated actual costs in pandas and writes them to a CSV file.
+    compute_project_utilization(output_path: str):
+        Computes the project utilization in pandas and writes it to a CSV file.
+    run_pipeline(csv_files: dict, accumulated_cost_path: str, project_utilization_path: str):
+        Computes both indicators straight from the CSV files in pandas, without the database.
     close_connection():
         Closes the SQLite database connection.
     """
 
-    def __init__(self, database_name: str):
+    # Known schemas of the source CSV files, passed to pd.read_csv to skip type inference.
+    CSV_SCHEMAS = {
+        'work_hours': {
+            'dtype': {'employee_id': 'int32', 'project_id': 'int32', 'worked': 'int64'},
+            'parse_dates': ['date'],
+        },
+        'time_off': {
+            'dtype': {'employee_id': 'int32'},
+            'parse_dates': ['date_start', 'date_end'],
+        },
+    }
+
+    # Indexes created on the source tables right after they are loaded.
+    TABLE_INDEXES = {
+        'work_hours': {
+            'idx_wh_emp_date': ('employee_id', 'date'),
+            # Matches the PARTITION BY/ORDER BY of the accumulated costs window, so SQLite streams
+            # it in index order instead of sorting; worked is included to make the index covering.
+            'idx_wh_proj_date': ('project_id', 'date', 'worked'),
+        },
+        'time_off': {'idx_to_emp_dates': ('employee_id', 'date_start', 'date_end')},
+    }
+
+    # Number of rows fetched from a cursor at a time when writing query results.
+    FETCH_SIZE = 65536
+
+    # Number of leading CSV rows sampled to infer column types in load_csv_directly.
+    TYPE_SAMPLE_SIZE = 1000
+
+    # Rows per Parquet row group, sized for typical full-column scans by downstream readers.
+    PARQUET_ROW_GROUP_SIZE = 1_000_000
+
+    # Arrow type (pyarrow alias) of columns that are still entirely NULL when the output schema is settled.
+    PARQUET_NULL_TYPE = 'string'
+
+    # Columns computed once at load time so queries group on integers instead of formatted strings.
+    # month_idx = year * 12 + (month - 1); written with substr/CAST so it runs on SQLite and DuckDB.
+    DERIVED_COLUMNS = {
+        'work_hours': {
+            'month_idx': 'CAST(substr(CAST("date" AS TEXT), 1, 4) AS INTEGER) * 12 + CAST(substr(CAST("date" AS TEXT), 6, 2) AS INTEGER) - 1',
+        },
+        'all_working_days': {
+            'month_idx': 'CAST(substr(CAST("Date" AS TEXT), 1, 4) AS INTEGER) * 12 + CAST(substr(CAST("Date" AS TEXT), 6, 2) AS INTEGER) - 1',
+        },
+    }
+
+    # Always safe: bigger page cache, memory-mapped reads and in-memory temp tables.
+    PERFORMANCE_PRAGMAS = (
+        'PRAGMA temp_store = MEMORY',
+        'PRAGMA cache_size = -262144',
+        'PRAGMA mmap_size = 268435456',
+    )
+
+    # Trade crash safety for bulk-load speed (no fsync, no on-disk journal). The exclusive
+    # locking mode is left out so extra connections can query the database concurrently.
+    NON_DURABLE_PRAGMAS = (
+        'PRAGMA journal_mode = MEMORY',
+        'PRAGMA synchronous = OFF',
+    )
+
+    def __init__(self, database_name: str, durable: bool = False, persistent: bool = False, backend: str = 'sqlite'):
         """
         Constructs all the necessary attributes for the FeedzaiChallenge object.
 
@@ -37,19 +154,62 @@ class FeedzaiChallenge:
         -----------
         database_name : str
             The name of the SQLite database to create and connect to.
+        durable : bool, optional
+            Keep SQLite's default journaling and fsync behaviour (default False).
+            The database is a throwaway analytical copy rebuilt from the CSV files
+            on every run, so durability is irrelevant and disabled by default.
+        persistent : bool, optional
+            Store the database in the database directory (default False). When False, the
+            database lives in a shared-cache in-memory SQLite database for the lifetime of
+            the object, so nothing is written to disk.
+        backend : str, optional
+            'sqlite' (default) or 'duckdb'. DuckDB runs the same queries on its vectorized,
+            multi-threaded engine and reads the CSV files natively; it requires the optional
+            duckdb package and ignores the SQLite PRAGMAs.
+
+        Raises:
+        -------
+        ValueError
+            If the backend is not supported.
+        ImportError
+            If the duckdb backend is requested but duckdb is not installed.
         """
         self.database_name = database_name
-        self.conn = sqlite3.connect(f'database/{self.database_name}.db')
+        self.durable = durable
+        self.persistent = persistent
+        self.backend = backend
         self.dfs = {}
 
-    def read_csv_files(self, csv_files: dict):
+        if backend == 'duckdb':
+            if duckdb is None:
+                raise ImportError("The duckdb backend requires the duckdb package")
+            self.conn = duckdb.connect(f'database/{self.database_name}.duckdb' if self.persistent else ':memory:')
+            return
+        if backend != 'sqlite':
+            raise ValueError(f"Unsupported backend {backend}, expected 'sqlite' or 'duckdb'")
+
+        self.conn = sqlite3.connect(self._database_uri(), uri=True)
+        for pragma in self.PERFORMANCE_PRAGMAS:
+            self.conn.execute(pragma)
+        if not self.durable:
+            for pragma in self.NON_DURABLE_PRAGMAS:
+                self.conn.execute(pragma)
+
+    def read_csv_files(self, csv_files: dict, schemas: dict = None):
         """
         Reads CSV files into DataFrames and stores them in a dictionary.
 
+        Files are parsed with pyarrow's multi-threaded CSV reader when pyarrow is
+        installed, falling back to pandas' C parser otherwise.
+
         Parameters:
         -----------
         csv_files : dict
             A dictionary where keys are table names and values are file paths to the CSV files.
+        schemas : dict, optional
+            A dictionary where keys are table names and values are keyword arguments for
+            pd.read_csv ('dtype', 'parse_dates' and optionally 'usecols'). Defaults to
+            CSV_SCHEMAS; tables without a schema are read with type inference.
 
         Raises:
         -------
@@ -57,8 +217,9 @@ class FeedzaiChallenge:
             If there is an error reading any of the CSV files.
         """
         try:
+            schemas = self.CSV_SCHEMAS if schemas is None else schemas
             for file in csv_files:
-                self.dfs[file] = pd.read_csv(csv_files[file])
+                self.dfs[file] = pd.read_csv(csv_files[file], engine=CSV_ENGINE, **schemas.get(file, {}))
         except Exception as ex:
             print(f"Error reading file {file}: {ex}")
             raise ex
@@ -67,6 +228,9 @@ class FeedzaiChallenge:
         """
         Loads a DataFrame into the SQLite database as a table.
 
+        Date columns are stored as 'YYYY-MM-DD' text, the format the SQL queries expect
+        (as DATE columns with the duckdb backend).
+
         Parameters:
         -----------
         table_name : str
@@ -78,40 +242,670 @@ class FeedzaiChallenge:
             If there is an error loading data into the SQLite database.
         """
         try:
-            self.dfs[table_name].to_sql(table_name, self.conn, if_exists='replace', index=False)
+            df = self.dfs[table_name]
+            date_columns = df.select_dtypes('datetime').columns
+            if self.backend == 'duckdb':
+                dates = ', '.join(f'CAST("{column}" AS DATE) AS "{column}"' for column in date_columns)
+                self.conn.register('source_frame', df)
+                self.conn.execute(
+                    f'CREATE OR REPLACE TABLE "{table_name}" AS '
+                    f'SELECT *{f" REPLACE ({dates})" if dates else ""} FROM source_frame'
+                )
+                self.conn.unregister('source_frame')
+            else:
+                df = df.assign(**{column: df[column].dt.strftime('%Y-%m-%d') for column in date_columns})
+                df.to_sql(table_name, self.conn, if_exists='replace', index=False)
+            self._add_derived_columns(table_name)
+            self._create_indexes(table_name)
         except Exception as ex:
             print(f"Error loading data into {table_name}: {ex}")
             raise ex
 
-    def query_data(self, query: str, output_path: str):
+    def load_csv_directly(self, table_name: str, path: str):
         """
-        Executes a SQL query and writes the results to a CSV file.
+        Streams a CSV file straight into the SQLite database as a table, without
+        building an intermediate DataFrame.
+
+        Blank lines are skipped and empty fields are loaded as NULL. Each column gets the
+        widest type (INTEGER < REAL < TEXT) of its non-empty values within the first
+        TYPE_SAMPLE_SIZE rows, and SQLite's type affinity converts the rows on insert.
+        With the duckdb backend the file is read by DuckDB's own CSV reader, using the
+        integer types declared in CSV_SCHEMAS.
+
+        Parameters:
+        -----------
+        table_name : str
+            The name of the table to create in the SQLite database.
+        path : str
+            The file path to the CSV file.
+
+        Raises:
+        -------
+        Exception
+            If there is an error loading the CSV file into the SQLite database.
+        """
+        try:
+            if self.backend == 'duckdb':
+                dtypes = self.CSV_SCHEMAS.get(table_name, {}).get('dtype', {})
+                types = ', '.join(f"'{column}': '{DUCKDB_TYPES[dtype]}'" for column, dtype in dtypes.items())
+                self.conn.execute(
+                    f'CREATE OR REPLACE TABLE "{table_name}" AS '
+                    f"SELECT * FROM read_csv_auto('{path}', header = true, types = {{{types}}})"
+                )
+            else:
+                # utf-8-sig strips a BOM from the first column name, like pandas does
+                with open(path, 'r', newline='', encoding='utf-8-sig') as file:
+                    reader = csv.reader(file)
+                    header = next(reader)
+
+                    # Blank lines are skipped and empty fields are loaded as NULL, like pandas does
+                    rows = ([value if value != '' else None for value in row] for row in reader if row)
+                    sample = list(islice(rows, self.TYPE_SAMPLE_SIZE))
+
+                    # Widest type over the non-empty sampled values of each column (INTEGER < REAL < TEXT)
+                    type_order = ('INTEGER', 'REAL', 'TEXT')
+                    types = [
+                        max((self._infer_type(row[i]) for row in sample if row[i] is not None), key=type_order.index, default='TEXT')
+                        for i in range(len(header))
+                    ]
+                    columns = ', '.join(f'"{name}" {col_type}' for name, col_type in zip(header, types))
+                    qmarks = ', '.join('?' * len(header))
+
+                    with self.conn:
+                        self.conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                        self.conn.execute(f'CREATE TABLE "{table_name}" ({columns})')
+                        self.conn.executemany(f'INSERT INTO "{table_name}" VALUES ({qmarks})', chain(sample, rows))
+            self._add_derived_columns(table_name)
+            self._create_indexes(table_name)
+        except Exception as ex:
+            print(f"Error loading {path} into {table_name}: {ex}")
+            raise ex
+
+    def _add_derived_columns(self, table_name: str):
+        """
+        Adds and fills the columns declared in DERIVED_COLUMNS for a freshly loaded table.
+
+        Parameters:
+        -----------
+        table_name : str
+            The name of the table to extend.
+        """
+        for column, expression in self.DERIVED_COLUMNS.get(table_name, {}).items():
+            self.conn.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{column}" INTEGER')
+            self.conn.execute(f'UPDATE "{table_name}" SET "{column}" = {expression}')
+        if self.backend == 'sqlite':
+            self.conn.commit()
+
+    def _create_indexes(self, table_name: str):
+        """
+        Creates the indexes declared in TABLE_INDEXES for a freshly loaded table
+        (SQLite only, DuckDB scans don't benefit from them).
+
+        Parameters:
+        -----------
+        table_name : str
+            The name of the table to index.
+        """
+        if self.backend == 'duckdb':
+            return
+
+        with self.conn:
+            for index_name, columns in self.TABLE_INDEXES.get(table_name, {}).items():
+                column_list = ', '.join(f'"{column}"' for column in columns)
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table_name}" ({column_list})')
+
+    @staticmethod
+    def _infer_type(value: str) -> str:
+        """
+        Infers the SQLite column type of a single CSV value.
+
+        Parameters:
+        -----------
+        value : str
+            The raw CSV value.
+
+        Returns:
+        --------
+        str
+            'INTEGER', 'REAL' or 'TEXT' (also for an empty value).
+        """
+        for cast, col_type in ((int, 'INTEGER'), (float, 'REAL')):
+            try:
+                cast(value)
+                return col_type
+            except ValueError:
+                pass
+        return 'TEXT'
+
+    def build_working_days(self):
+        """
+        Creates the all_working_days table with every business day (Monday to Friday)
+        between the earliest and the latest date found in work_hours and time_off.
+
+        The calendar is generated with pandas.bdate_range (generate_series with the duckdb
+        backend) instead of a recursive CTE, so queries_sql/project_utilization.sql only
+        has to reference the table.
+
+        Raises:
+        -------
+        Exception
+            If there is an error reading the date range or creating the table.
+        """
+        try:
+            min_date, max_date = self.conn.execute("""
+                SELECT min(d), max(d) FROM (
+                    SELECT date AS d FROM work_hours
+                    UNION ALL SELECT date_start FROM time_off
+                    UNION ALL SELECT date_end FROM time_off
+                )
+            """).fetchone()
+
+            if self.backend == 'duckdb':
+                self.conn.execute("""
+                    CREATE OR REPLACE TABLE all_working_days AS
+                    SELECT CAST(day AS DATE) AS Date
+                    FROM generate_series(CAST(? AS TIMESTAMP), CAST(? AS TIMESTAMP), INTERVAL 1 DAY) AS days(day)
+                    WHERE dayofweek(day) NOT IN (0, 6)
+                """, [min_date, max_date])
+            else:
+                working_days = pd.DataFrame({'Date': pd.bdate_range(min_date, max_date).strftime('%Y-%m-%d')})
+                working_days.to_sql('all_working_days', self.conn, if_exists='replace', index=False)
+            self._add_derived_columns('all_working_days')
+        except Exception as ex:
+            print(f"Error building the working days calendar: {ex}")
+            raise ex
+
+    def query_data(self, query: str, output_path: str, conn: sqlite3.Connection = None, output_format: str = 'csv'):
+        """
+        Executes a SQL query and writes the results to a CSV or Parquet file.
+
+        The SQL may contain several statements separated by ';' (e.g. to build temporary
+        tables); they are executed in order and the result of the last one is written.
+
+        Rows are fetched from the cursor in batches of FETCH_SIZE and streamed straight to
+        csv.writer (or turned into Arrow record batches for Parquet and Arrow CSV), without
+        building a DataFrame.
 
         Parameters:
         -----------
         query : str
             The SQL query to execute or the path to the SQL file.
         output_path : str
-            The file path where the query results will be saved as a CSV file.
+            The file path where the query results will be saved.
+        conn : sqlite3.Connection, optional
+            The connection to run the query on. Defaults to the object's connection.
+        output_format : str, optional
+            'csv' (default), 'arrow_csv' or 'parquet'. 'arrow_csv' writes the CSV with
+            pyarrow's multi-threaded C++ writer, which pays off for the largest results
+            (string fields are always quoted). Parquet files are zstd-compressed with
+            dictionary encoding, so downstream consumers load typed columns without parsing
+            text. Both require pyarrow.
 
         Raises:
         -------
+        ValueError
+            If the output format is not supported.
+        ImportError
+            If the arrow_csv or parquet output format is requested but pyarrow is not installed.
         Exception
-            If there is an error executing the query or writing the results to the CSV file.
+            If there is an error executing the query or writing the results to the output file.
         """
+        if output_format not in ('csv', 'arrow_csv', 'parquet'):
+            raise ValueError(f"Unsupported output format {output_format}, expected 'csv', 'arrow_csv' or 'parquet'")
+        if output_format != 'csv' and not HAS_PYARROW:
+            raise ImportError(f"The {output_format} output format requires the pyarrow package")
+
+        conn = self.conn if conn is None else conn
         try:
             if os.path.isfile(query):
-                with open(query, 'r', encoding='utf-8') as file:
-                    query_str = file.read()
+                query_str = _load_sql(query, os.path.getmtime(query))
             else:
                 query_str = query
 
-            result = pd.read_sql_query(query_str, self.conn)
-            result.to_csv(output_path, index=False)
+            *setup_statements, final_statement = self._split_statements(query_str)
+            for statement in setup_statements:
+                conn.execute(statement)
+
+            cursor = conn.execute(final_statement)
+            if output_format == 'parquet':
+                self._write_parquet(cursor, output_path)
+            elif output_format == 'arrow_csv':
+                self._write_arrow_csv(cursor, output_path)
+            else:
+                self._write_csv(cursor, output_path)
         except Exception as ex:
             print(f"Error executing query or writing to {output_path}: {ex}")
             raise ex
 
+    def query_data_concurrently(self, queries: dict, output_format: str = 'csv'):
+        """
+        Executes several SQL queries in parallel threads and writes each result to a CSV
+        or Parquet file.
+
+        sqlite3 connections can't be shared between threads, so every query runs on its own
+        connection from open_read_connection: read-only for a persistent SQLite database,
+        a shared-cache connection to the in-memory database otherwise, and a cursor with
+        the duckdb backend. SQLite releases the GIL while stepping through a statement, so
+        the queries overlap.
+
+        Parameters:
+        -----------
+        queries : dict
+            A dictionary where keys are SQL queries or paths to SQL files and values are the
+            file paths where the query results will be saved.
+        output_format : str, optional
+            'csv' (default), 'arrow_csv' or 'parquet', see query_data.
+
+        Raises:
+        -------
+        Exception
+            If there is an error executing any of the queries or writing its results.
+        """
+        def run(query: str, output_path: str):
+            conn = self.open_read_connection()
+            try:
+                self.query_data(query, output_path, conn, output_format)
+            finally:
+                conn.close()
+
+        with ThreadPoolExecutor(max_workers=len(queries) or 1) as executor:
+            futures = [executor.submit(run, query, output_path) for query, output_path in queries.items()]
+            for future in futures:
+                future.result()
+
+    def open_read_connection(self) -> sqlite3.Connection:
+        """
+        Opens an extra connection to the database for running queries.
+
+        For a persistent SQLite database the connection is read-only. In-memory databases
+        can't be opened read-only, so for them it is a regular (writable) connection sharing
+        the in-memory database with the main one. With the duckdb backend this is a new
+        cursor (DuckDB's per-thread connection) on the same database.
+
+        Returns:
+        --------
+        sqlite3.Connection or duckdb.DuckDBPyConnection
+            The connection, with the same performance PRAGMAs as the main one.
+        """
+        if self.backend == 'duckdb':
+            return self.conn.cursor()
+
+        conn = sqlite3.connect(self._database_uri(read_only=True), uri=True)
+        for pragma in self.PERFORMANCE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _database_uri(self, read_only: bool = False) -> str:
+        """
+        Builds the SQLite URI of the database.
+
+        Parameters:
+        -----------
+        read_only : bool, optional
+            Open the on-disk database in read-only mode (default False).
+
+        Returns:
+        --------
+        str
+            The URI to pass to sqlite3.connect with uri=True.
+        """
+        if not self.persistent:
+            return f'file:{self.database_name}?mode=memory&cache=shared'
+        return f'file:database/{self.database_name}.db' + ('?mode=ro' if read_only else '')
+
+    def _write_csv(self, cursor, output_path: str):
+        """
+        Writes the rows of an executed cursor to a CSV file, FETCH_SIZE rows at a time.
+
+        Parameters:
+        -----------
+        cursor : sqlite3.Cursor
+            The cursor holding the query results.
+        output_path : str
+            The file path where the rows will be saved as a CSV file.
+        """
+        with open(output_path, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow([column[0] for column in cursor.description])
+            while rows := cursor.fetchmany(self.FETCH_SIZE):
+                writer.writerows(rows)
+
+    def _write_parquet(self, cursor, output_path: str):
+        """
+        Streams the rows of an executed cursor to a zstd-compressed Parquet file, one row
+        group of PARQUET_ROW_GROUP_SIZE rows at a time.
+
+        Parameters:
+        -----------
+        cursor : sqlite3.Cursor
+            The cursor holding the query results.
+        output_path : str
+            The file path where the rows will be saved as a Parquet file.
+        """
+        self._write_arrow(
+            cursor,
+            lambda schema: pq.ParquetWriter(output_path, schema, compression='zstd', use_dictionary=True),
+            row_group_size=self.PARQUET_ROW_GROUP_SIZE
+        )
+
+    def _write_arrow_csv(self, cursor, output_path: str):
+        """
+        Streams the rows of an executed cursor to a CSV file with pyarrow's CSV writer.
+
+        Parameters:
+        -----------
+        cursor : sqlite3.Cursor
+            The cursor holding the query results.
+        output_path : str
+            The file path where the rows will be saved as a CSV file.
+        """
+        write_options = pacsv.WriteOptions(include_header=True, quoting_style='needed')
+        self._write_arrow(cursor, lambda schema: pacsv.CSVWriter(output_path, schema, write_options=write_options))
+
+    def _write_arrow(self, cursor, open_writer, **write_kwargs):
+        """
+        Streams the rows of an executed cursor to an Arrow writer, PARQUET_ROW_GROUP_SIZE
+        rows at a time.
+
+        Each fetched batch infers its own column types and SQLite columns may hold mixed
+        types, so the types of the batches in the first PARQUET_ROW_GROUP_SIZE rows are
+        widened into a single schema (NULL < integer < float, anything else falls back to
+        string). Columns still entirely NULL at that point get PARQUET_NULL_TYPE. The writer
+        is then opened and every batch is cast to that schema; a later batch that can't be
+        cast without losing data raises a ValueError.
+
+        Parameters:
+        -----------
+        cursor : sqlite3.Cursor
+            The cursor holding the query results.
+        open_writer : callable
+            Opens the writer (pq.ParquetWriter or pacsv.CSVWriter) for a given schema.
+        **write_kwargs
+            Extra keyword arguments for the writer's write_table.
+
+        Raises:
+        -------
+        ValueError
+            If a column changes to a wider type after the first rows were written.
+        """
+        columns = [column[0] for column in cursor.description]
+        types = [pa.null()] * len(columns)
+        pending = []
+        pending_rows = 0
+        writer = None
+        schema = None
+
+        def flush():
+            nonlocal writer, schema, pending, pending_rows
+            if writer is None:
+                null_type = pa.type_for_alias(self.PARQUET_NULL_TYPE)
+                schema = pa.schema([(column, null_type if pa.types.is_null(t) else t) for column, t in zip(columns, types)])
+                writer = open_writer(schema)
+            if pending:
+                try:
+                    table = pa.concat_tables([pa.Table.from_batches([batch]).cast(schema) for batch in pending])
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
+                    raise ValueError(
+                        f"Query result types changed after the first {self.PARQUET_ROW_GROUP_SIZE} rows "
+                        f"and no longer fit the schema {schema}: {ex}"
+                    ) from ex
+                writer.write_table(table, **write_kwargs)
+            pending = []
+            pending_rows = 0
+
+        try:
+            for batch in self._fetch_arrow_batches(cursor):
+                if writer is None:
+                    types = [self._widen_type(old, new) for old, new in zip(types, batch.schema.types)]
+                pending.append(batch)
+                pending_rows += batch.num_rows
+
+                if pending_rows >= self.PARQUET_ROW_GROUP_SIZE:
+                    flush()
+            flush()
+        finally:
+            if writer is not None:
+                writer.close()
+
+    @staticmethod
+    def _widen_type(old, new):
+        """
+        Returns the narrowest Arrow type holding the values of both types.
+
+        Parameters:
+        -----------
+        old : pyarrow.DataType
+            The type settled so far.
+        new : pyarrow.DataType
+            The type of the next batch.
+
+        Returns:
+        --------
+        pyarrow.DataType
+            The null, integer, float or string type covering both.
+        """
+        if old == new or pa.types.is_null(new):
+            return old
+        if pa.types.is_null(old):
+            return new
+        numeric = (pa.types.is_integer, pa.types.is_floating)
+        if any(is_type(old) for is_type in numeric) and any(is_type(new) for is_type in numeric):
+            return pa.int64() if pa.types.is_integer(old) and pa.types.is_integer(new) else pa.float64()
+        return pa.string()
+
+    def _fetch_arrow_batches(self, cursor):
+        """
+        Fetches the rows of an executed cursor FETCH_SIZE at a time as Arrow record batches.
+
+        Parameters:
+        -----------
+        cursor : sqlite3.Cursor
+            The cursor holding the query results.
+
+        Yields:
+        -------
+        pyarrow.RecordBatch
+            The next batch of rows.
+        """
+        columns = [column[0] for column in cursor.description]
+        while rows := cursor.fetchmany(self.FETCH_SIZE):
+            yield pa.RecordBatch.from_arrays([self._to_arrow_array(values) for values in zip(*rows)], names=columns)
+
+    @staticmethod
+    def _to_arrow_array(values: tuple):
+        """
+        Converts the values of one column of a fetched batch into an Arrow array, falling
+        back to strings when SQLite returned mixed types (e.g. integers and text).
+
+        Parameters:
+        -----------
+        values : tuple
+            The column values.
+
+        Returns:
+        --------
+        pyarrow.Array
+            The Arrow array.
+        """
+        try:
+            return pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([None if value is None else str(value) for value in values], pa.string())
+
+    @staticmethod
+    def _split_statements(sql: str) -> list:
+        """
+        Splits a SQL script into its individual statements. Pieces holding only
+        comments or whitespace (e.g. a comment after the last ';') are dropped.
+
+        Parameters:
+        -----------
+        sql : str
+            The SQL script.
+
+        Returns:
+        --------
+        list
+            The statements of the script, in order.
+        """
+        statements = []
+        buffer = ''
+        for piece in sql.split(';'):
+            buffer += piece + ';'
+            if sqlite3.complete_statement(buffer):
+                if not FeedzaiChallenge._is_blank_sql(buffer):
+                    statements.append(buffer)
+                buffer = ''
+        if not FeedzaiChallenge._is_blank_sql(buffer):
+            statements.append(buffer.rstrip(';'))
+        return statements
+
+    @staticmethod
+    def _is_blank_sql(sql: str) -> bool:
+        """
+        Checks whether a piece of SQL holds nothing but comments, whitespace and ';'.
+
+        Parameters:
+        -----------
+        sql : str
+            The piece of SQL.
+
+        Returns:
+        --------
+        bool
+            True if there is no statement to execute.
+        """
+        return not re.sub(r'--[^\n]*|/\*.*?\*/', '', sql, flags=re.DOTALL).strip(' \t\r\n;')
+
+    def compute_accumulated_cost(self, output_path: str):
+        """
+        Computes the accumulated actual costs per project (same result as
+        queries_sql/acumulated_actual_costs.sql) directly from the work_hours
+        DataFrame, using a grouped cumulative sum instead of SQLite's window function.
+
+        Parameters:
+        -----------
+        output_path : str
+            The file path where the results will be saved as a CSV file.
+
+        Raises:
+        -------
+        Exception
+            If there is an error computing the costs or writing the results to the CSV file.
+        """
+        try:
+            wh = self.dfs['work_hours'].sort_values(['project_id', 'date'], kind='mergesort')
+            # worked is in thousandths of an hour at 100$/hour: sum the integers, divide by 10 once
+            wh['total_accumulated_cost'] = wh.groupby('project_id', sort=False)['worked'].cumsum() / 10
+            wh[['project_id', 'date', 'total_accumulated_cost']].to_csv(output_path, index=False)
+        except Exception as ex:
+            print(f"Error computing accumulated costs or writing to {output_path}: {ex}")
+            raise ex
+
+    def compute_project_utilization(self, output_path: str):
+        """
+        Computes the project utilization per employee, month and project (same result as
+        queries_sql/project_utilization.sql) directly from the work_hours and time_off
+        DataFrames. Time off periods without a start or an end date are treated as
+        starting at the first or ending at the last date of the calendar.
+
+        Instead of cross joining every employee with every working day, the business days
+        of each month and the business days of each time off period falling in that month
+        are counted with np.busday_count over a (time off rows x months) grid.
+
+        Parameters:
+        -----------
+        output_path : str
+            The file path where the results will be saved as a CSV file.
+
+        Raises:
+        -------
+        Exception
+            If there is an error computing the utilization or writing the results to the CSV file.
+        """
+        try:
+            wh = self.dfs['work_hours']
+            to = self.dfs['time_off']
+            wh_date = pd.to_datetime(wh['date'])
+            to_start = pd.to_datetime(to['date_start'])
+            to_end = pd.to_datetime(to['date_end'])
+
+            min_date = min(wh_date.min(), to_start.min(), to_end.min())
+            max_date = max(wh_date.max(), to_start.max(), to_end.max())
+
+            # Open-ended time off (missing start or end) runs from/to the calendar bounds,
+            # which is what the NULL comparisons in the SQL amount to
+            to_start = to_start.fillna(min_date)
+            to_end = to_end.fillna(max_date)
+
+            # First day and day after the last day of each month, clipped to the calendar
+            months = pd.period_range(min_date, max_date, freq='M')
+            month_start = np.maximum(months.start_time.values.astype('datetime64[D]'), np.datetime64(min_date.date()))
+            month_stop = np.minimum(months.end_time.values.astype('datetime64[D]'), np.datetime64(max_date.date())) + 1
+
+            # Business days per month, and business days taken off per time off row and month
+            # (rows x months), each counted with a single vectorized np.busday_count call.
+            # to_start/to_end were filled above: np.busday_count rejects NaT dates.
+            month_days = np.busday_count(month_start, month_stop)
+            off_start = np.maximum(to_start.values.astype('datetime64[D]')[:, None], month_start)
+            off_stop = np.minimum(to_end.values.astype('datetime64[D]')[:, None] + 1, month_stop)
+            off_days = np.maximum(np.busday_count(off_start, off_stop), 0)
+
+            # Available hours per time off row and month, then per employee and month
+            hours = (month_days - off_days) * 8
+            rows, cols = np.nonzero(hours > 0)
+            available = pd.DataFrame({
+                'employee_id': to['employee_id'].values[rows],
+                'employee_name': to['employee_name'].values[rows],
+                'work_month': months[cols],
+                'hours': hours[rows, cols],
+            })
+            available = available.groupby(['employee_id', 'employee_name', 'work_month'], as_index=False)['hours'].sum()
+
+            # Worked thousandths of an hour per employee, month and project (kept as integers)
+            worked = wh.groupby([wh['employee_id'], wh_date.dt.to_period('M').rename('work_month'), wh['project_id']])['worked'].sum()
+            worked = worked.rename('worked_total').reset_index()
+
+            # 100 * (worked_total / 1000) / hours
+            result = worked.merge(available, on=['employee_id', 'work_month'])
+            result['project_utilization_percent'] = result['worked_total'] / (10.0 * result['hours'])
+            result['work_month'] = result['work_month'].astype(str)
+            result[['employee_name', 'work_month', 'project_id', 'project_utilization_percent']].to_csv(output_path, index=False)
+        except Exception as ex:
+            print(f"Error computing project utilization or writing to {output_path}: {ex}")
+            raise ex
+
+    def run_pipeline(self, csv_files: dict, accumulated_cost_path: str, project_utilization_path: str):
+        """
+        Computes both indicators straight from the CSV files in a single pandas pass,
+        skipping the read -> load into the database -> query back round-trip.
+
+        Only the columns the indicators need are read, with the schemas of CSV_SCHEMAS.
+
+        Parameters:
+        -----------
+        csv_files : dict
+            A dictionary with the 'work_hours' and 'time_off' file paths.
+        accumulated_cost_path : str
+            The file path where the accumulated actual costs will be saved as a CSV file.
+        project_utilization_path : str
+            The file path where the project utilization will be saved as a CSV file.
+
+        Raises:
+        -------
+        Exception
+            If there is an error reading the CSV files, computing the indicators or writing them.
+        """
+        usecols = {
+            'work_hours': ['employee_id', 'date', 'project_id', 'worked'],
+            'time_off': ['employee_id', 'employee_name', 'date_start', 'date_end'],
+        }
+        schemas = {table: {**self.CSV_SCHEMAS[table], 'usecols': columns} for table, columns in usecols.items()}
+
+        self.read_csv_files(csv_files, schemas)
+        self.compute_accumulated_cost(accumulated_cost_path)
+        self.compute_project_utilization(project_utilization_path)
+
     def close_connection(self):
         """
         Closes the SQLite database connection.
@@ -138,15 +932,18 @@ if __name__ == "__main__":
         'work_hours': r'csv_sources\work_hours.csv'
     }
 
-    # Reading .csv files from dictionary
-    feedzai.read_csv_files(csv_files)
+    # Streaming .csv files straight into the database
+    for table_name, path in csv_files.items():
+        feedzai.load_csv_directly(table_name, path)
 
-    # Loading tables into database
-    feedzai.load_data('work_hours')
-    feedzai.load_data('time_off')
+    # Business days calendar used by the project utilization query
+    feedzai.build_working_days()
 
-    feedzai.query_data(r'queries_sql\acumulated_actual_costs.sql', r'output_files\acumulated_actual_costs.csv')
-    feedzai.query_data(r'queries_sql\project_utilization.sql', r'output_files\project_utilization.csv')
+    # Running both queries in parallel, each on its own connection to the in-memory database
+    feedzai.query_data_concurrently({
+        r'queries_sql\acumulated_actual_costs.sql': r'output_files\acumulated_actual_costs.csv',
+        r'queries_sql\project_utilization.sql': r'output_files\project_utilization.csv'
+    })
 
     # Closing database connection
     feedzai.close_connection()
@@ -4,6 +4,7 @@
 SELECT
     project_id,
     date,
-    SUM((worked/1000.0)*100.0) OVER (PARTITION BY project_id ORDER BY date ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) AS total_accumulated_cost
+    -- worked is in thousandths of an hour: sum the integers and convert once per output row.
+    SUM(worked) OVER (PARTITION BY project_id ORDER BY date ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) / 10.0 AS total_accumulated_cost
 FROM
     work_hours;
\ No newline at end of file
@@ -2,43 +2,40 @@
 -- available hours each employee is allocated to a project, per month, assuming 8h/day of work time for each employee
 -- except on weekends and time off.
 
-with max_min as (
-    SELECT date from work_hours UNION SELECT date_start FROM time_off UNION SELECT date_end FROM time_off
-),
-all_working_days as (
-    with RECURSIVE DateRange AS (
-        SELECT min(date) AS Date FROM max_min
-        UNION ALL
-        SELECT DATE(Date, '+1 day') FROM DateRange WHERE Date < (select max(date) from max_min)
-    )
-    SELECT Date
-    FROM DateRange
-    WHERE strftime('%w', Date) NOT IN ('0', '6')
-),
-available_work_hours_per_user as (
+-- all_working_days (business days between the first and the last date of the sources) is built by
+-- FeedzaiChallenge.build_working_days before this query runs.
+
+-- The intermediate steps are materialized as indexed temporary tables so the final join probes them
+-- instead of recomputing them. They group on the integer month_idx column (year * 12 + month - 1) added
+-- at load time; the 'YYYY-MM' month is only formatted in the final SELECT.
+DROP TABLE IF EXISTS temp.available_work_hours_per_user;
+CREATE TEMP TABLE available_work_hours_per_user AS
     SELECT
         t.employee_id,
         t.employee_name,
-        STRFTIME('%Y-%m', d.Date) as work_month,
+        d.month_idx,
+        min(d.Date) as month_first_day,
         count(d.Date)*8 as hours
     FROM time_off t
     CROSS JOIN all_working_days d
     WHERE d.Date < t.date_start OR d.Date > t.date_end
-    group by employee_id, employee_name, work_month
-),
-worked_hours_by_month_by_project_by_employee as (
+    group by t.employee_id, t.employee_name, d.month_idx;
+CREATE INDEX idx_available_emp_month ON available_work_hours_per_user(employee_id, month_idx);
+
+DROP TABLE IF EXISTS temp.worked_hours_by_month_by_project_by_employee;
+CREATE TEMP TABLE worked_hours_by_month_by_project_by_employee AS
     SELECT
         wh.employee_id,
-        STRFTIME('%Y-%m', wh.date) as work_month,
+        wh.month_idx,
         wh.project_id,
-        sum(wh.worked)/1000.0 as worked_total
+        sum(wh.worked) as worked_total
     FROM work_hours wh
-    GROUP BY employee_id, work_month, project_id
-)
+    GROUP BY wh.employee_id, wh.month_idx, wh.project_id;
+
 SELECT 
     ah.employee_name,
-    ah.work_month,
+    substr(CAST(ah.month_first_day AS TEXT), 1, 7) as work_month,
     wh.project_id,
-    100.0*wh.worked_total/ah.hours as project_utilization_percent
+    wh.worked_total/(10.0*ah.hours) as project_utilization_percent
 FROM worked_hours_by_month_by_project_by_employee wh
-JOIN available_work_hours_per_user ah ON ah.employee_id = wh.employee_id AND ah.work_month = wh.work_month
+JOIN available_work_hours_per_user ah ON ah.employee_id = wh.employee_id AND ah.month_idx = wh.month_idx